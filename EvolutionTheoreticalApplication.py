@@ -40,20 +40,22 @@ class DNABPE {
       dna.push(this.codons[c1], this.codons[c2], this.codons[c3], this.codons[c4]);
     }
     
-    dna.push(this.STOP_CODONS[0]);
+    // The STOP codon records how many zero bytes pad the last group (0/1/2)
+    dna.push(this.STOP_CODONS[(3 - bytes.length % 3) % 3]);
     return dna;
   }
   
   decode(dna) {
     const startIdx = dna.indexOf(this.START);
     let endIdx = dna.length;
+    let padding = 0;
     
-    for (let stopCodon of this.STOP_CODONS) {
-      const idx = dna.indexOf(stopCodon);
-      if (idx !== -1 && idx > startIdx) {
-        endIdx = idx;
-        break;
-      }
+    // The closing STOP is always the last codon; packed codons in between may
+    // themselves spell a STOP, so they are never scanned for one
+    const padIdx = this.STOP_CODONS.indexOf(dna[dna.length - 1]);
+    if (padIdx !== -1 && dna.length - 1 > startIdx) {
+      endIdx = dna.length - 1;
+      padding = padIdx;
     }
     
     const codingSequence = dna.slice(startIdx + 1, endIdx);
@@ -73,6 +75,7 @@ class DNABPE {
       
       bytes.push(b1, b2, b3);
     }
+    bytes.length = Math.max(0, bytes.length - padding);
     
     try {
       return new TextDecoder().decode(new Uint8Array(bytes));
@@ -82,6 +85,70 @@ class DNABPE {
   }
 }
 
+// ============================================
+// MUTATION ENGINE
+// ============================================
+// Seedable PRNG (mulberry32) so evolution runs can be replayed
+const createRng = (seed) => {
+  let state = seed >>> 0;
+  return () => {
+    state = (state + 0x6D2B79F5) >>> 0;
+    let t = state;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+};
+
+class MutationEngine {
+  constructor(seed = Date.now()) {
+    this.seed = seed;
+    this.random = createRng(seed);
+    this.undoLog = [];
+    
+    // Codons as 6-bit values (2 bits per base, A=0 U=1 G=2 C=3)
+    this.codons = new DNABPE().codons;
+    this.codonIndex = {};
+    this.codons.forEach((codon, idx) => {
+      this.codonIndex[codon] = idx;
+    });
+  }
+  
+  // Codons skipped before the next mutation site: geometric with p = rate
+  nextGap(rate) {
+    if (rate >= 1) return 0;
+    return Math.floor(Math.log(1 - this.random()) / Math.log(1 - rate));
+  }
+  
+  // Point-mutate dna[from, to) in place, drawing only one gap per mutation
+  // instead of one random number per codon. Originals go to the undo log.
+  mutate(dna, rate, from = 0, to = dna.length) {
+    this.undoLog.length = 0;
+    if (rate <= 0) return 0;
+    
+    for (let i = from + this.nextGap(rate); i < to; i += 1 + this.nextGap(rate)) {
+      const shift = 2 * (2 - Math.floor(this.random() * 3)); // Which base
+      const base = Math.floor(this.random() * 4);
+      const value = this.codonIndex[dna[i]];
+      
+      this.undoLog.push(i, dna[i]);
+      dna[i] = this.codons[(value & ~(3 << shift)) | (base << shift)];
+    }
+    return this.undoLog.length / 2;
+  }
+  
+  // Roll back the last mutate() call
+  undo(dna) {
+    for (let k = this.undoLog.length - 2; k >= 0; k -= 2) {
+      dna[this.undoLog[k]] = this.undoLog[k + 1];
+    }
+    this.undoLog.length = 0;
+  }
+}
+
+const defaultMutationEngine = new MutationEngine();
+const MUTATION_SEED = 0xD1A;
+
 const MAGNOQUILL_CODE = `
 function creature(ctx, t, width, height) {
   const points = [];
@@ -229,7 +296,7 @@ class CodeOrganism {
     }
   }
 
-  static crossover(parent1, parent2, nextId, generation) {
+  static crossover(parent1, parent2, nextId, generation, random = Math.random) {
     const maxAttempts = 10;
     let attempts = 0;
     
@@ -240,23 +307,14 @@ class CodeOrganism {
 
       const start1 = dna1.indexOf('AUG');
       const start2 = dna2.indexOf('AUG');
-      const stopCodons = ['UAA', 'UAG', 'UGA'];
-
-      let end1 = dna1.length - 1;
-      let end2 = dna2.length - 1;
 
-      for (let i = start1; i < dna1.length; i++) {
-        if (stopCodons.includes(dna1[i])) {
-          end1 = i;
-          break;
-        }
-      }
-      for (let i = start2; i < dna2.length; i++) {
-        if (stopCodons.includes(dna2[i])) {
-          end2 = i;
-          break;
-        }
-      }
+      // DNA always closes with its STOP codon, which also carries the padding
+      // of the last group; offspring inherit it from whichever parent
+      // supplies their tail
+      const end1 = dna1.length - 1;
+      const end2 = dna2.length - 1;
+      const stop1 = dna1[end1];
+      const stop2 = dna2[end2];
 
       const coding1 = dna1.slice(start1 + 1, end1);
       const coding2 = dna2.slice(start2 + 1, end2);
@@ -264,25 +322,27 @@ class CodeOrganism {
       let offspringDNA;
       if (attempt < 3) {
         const minLen = Math.min(coding1.length, coding2.length);
-        const crossPoint = Math.floor(Math.random() * minLen);
+        const crossPoint = Math.floor(random() * minLen);
         offspringDNA = [
           'AUG',
           ...coding1.slice(0, crossPoint),
           ...coding2.slice(crossPoint),
-          'UAA'
+          stop2
         ];
       } else if (attempt < 6) {
-        const favorParent1 = Math.random() > 0.5;
-        const ratio = 0.7 + Math.random() * 0.2;
+        const favorParent1 = random() > 0.5;
+        const ratio = 0.7 + random() * 0.2;
         const crossPoint = favorParent1 
           ? Math.floor(coding1.length * ratio)
           : Math.floor(coding2.length * (1 - ratio));
         offspringDNA = favorParent1 
-          ? ['AUG', ...coding1.slice(0, crossPoint), ...coding2.slice(crossPoint), 'UAA']
-          : ['AUG', ...coding2.slice(0, crossPoint), ...coding1.slice(crossPoint), 'UAA'];
+          ? ['AUG', ...coding1.slice(0, crossPoint), ...coding2.slice(crossPoint), stop2]
+          : ['AUG', ...coding2.slice(0, crossPoint), ...coding1.slice(crossPoint), stop1];
       } else {
-        const parent = Math.random() > 0.5 ? coding1 : coding2;
-        offspringDNA = ['AUG', ...parent, 'UAA'];
+        const favorParent1 = random() > 0.5;
+        offspringDNA = favorParent1
+          ? ['AUG', ...coding1, stop1]
+          : ['AUG', ...coding2, stop2];
       }
 
       const decoder = new DNABPE();
@@ -316,35 +376,25 @@ class CodeOrganism {
     return organism;
   }
 
-  mutate(mutationRate = 0.01) {
-    const originalDNA = this.dna.slice();
-    const originalCode = this.code;
-    
-    const dna = this.dna.slice();
-    const bases = ['A', 'U', 'G', 'C'];
-    
+  mutate(mutationRate = 0.01, engine = defaultMutationEngine) {
     this._mutationAttempted = true;
 
-    for (let i = 1; i < dna.length - 1; i++) {
-      if (Math.random() < mutationRate) {
-        const codon = dna[i].split('');
-        const baseIdx = Math.floor(Math.random() * 3);
-        codon[baseIdx] = bases[Math.floor(Math.random() * bases.length)];
-        dna[i] = codon.join('');
-      }
+    // Edit in place between START and STOP; the engine logs what it changed
+    const mutations = engine.mutate(this.dna, mutationRate, 1, this.dna.length - 1);
+    if (mutations === 0) {
+      this._mutationRejected = false;
+      return;
     }
 
     const decoder = new DNABPE();
-    const newCode = decoder.decode(dna);
+    const newCode = decoder.decode(this.dna);
     
     try {
       new Function('ctx', 't', 'width', 'height', newCode + '; creature(ctx, t, width, height);');
       this.code = newCode;
-      this.dna = dna;
       this._mutationRejected = false;
     } catch (e) {
-      this.code = originalCode;
-      this.dna = originalDNA;
+      engine.undo(this.dna);
       this._mutationRejected = true;
     }
   }
@@ -354,6 +404,16 @@ export default function DNACodeEvolution() {
   const canvasRef = useRef(null);
   const hiddenCanvasRef = useRef(null);
   const nextIdRef = useRef(2);
+  const mutationEngineRef = useRef(null);
+
+  // Built on first use rather than as the ref's initial value, which would
+  // construct (and discard) an engine on every render
+  const getMutationEngine = () => {
+    if (!mutationEngineRef.current) {
+      mutationEngineRef.current = new MutationEngine(MUTATION_SEED);
+    }
+    return mutationEngineRef.current;
+  };
 
   const [organisms, setOrganisms] = useState(() => [
     new CodeOrganism(MAGNOQUILL_CODE, 0, 0),
@@ -459,19 +519,22 @@ export default function DNACodeEvolution() {
       const parent1 = survivors[i];
       const parent2 = survivors[(i + 1) % survivors.length];
 
+      // Crossover and mutation share the seeded stream so runs replay
+      const engine = getMutationEngine();
       const child = CodeOrganism.crossover(
         parent1,
         parent2,
         nextIdRef.current++,
-        newGen
+        newGen,
+        engine.random
       );
       
       // Collect crossover stats
       totalCrossoverAttempts += child._crossoverAttempts || 1;
       if (!child._isClone) totalCrossoverSuccesses++;
 
-      if (Math.random() < 0.1) {
-        child.mutate(0.01);
+      if (engine.random() < 0.1) {
+        child.mutate(0.01, engine);
         if (child._mutationAttempted) totalMutationAttempts++;
         if (child._mutationRejected) totalMutationRejections++;
       }
@@ -523,6 +586,7 @@ export default function DNACodeEvolution() {
     setGeneration(0);
     setTime(0);
     nextIdRef.current = 2;
+    mutationEngineRef.current = null; // Re-seeded on next use
     setEvolutionStats({
       crossoverAttempts: 0,
       crossoverSuccesses: 0,